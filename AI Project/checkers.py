@@ -8,9 +8,8 @@ Controls:
 """
 
 import pygame
+import random
 import sys
-import time
-from copy import deepcopy
 
 # ----- Config -----
 WIDTH, HEIGHT = 900, 820
@@ -32,27 +31,110 @@ ACCENT = (0, 255, 200)
 FPS = 60
 DEFAULT_TIMER = 5 * 60  # not mandatory to use
 
-# ----- Utilities -----
-def in_bounds(r, c):
-    return 0 <= r < ROWS and 0 <= c < COLS
+# ----- Bitboard Utilities -----
+# The board is a 4-tuple of ints (red_men, red_kings, blue_men, blue_kings).
+# Bit r*8 + c of each mask is set when that piece type occupies square (r, c).
+# All move generation goes through the precomputed STEP_TABLE/JUMP_TABLE
+# below, whose None entries already encode the board edges; FULL bounds the
+# complement when computing the empty-square mask.
+FULL = (1 << 64) - 1
 
-def clone_board(b):
-    return [row[:] for row in b]
+def sq_bit(r, c):
+    return 1 << (r*8 + c)
+
+def piece_at(board, r, c):
+    """Return 1/2/-1/-2 for the piece on (r, c), or 0 if empty."""
+    b = 1 << (r*8 + c)
+    red_men, red_kings, blue_men, blue_kings = board
+    if red_men & b: return 1
+    if red_kings & b: return 2
+    if blue_men & b: return -1
+    if blue_kings & b: return -2
+    return 0
+
+# Per-square move tables.  For every square and diagonal direction we
+# precompute the step target (bit, row, col) and the jump descriptor
+# (middle bit, landing bit, landing row, landing col), or None when the
+# target is off the board.  Lookups replace shift/mask arithmetic in the
+# hottest functions; directions are indexed 0..3 as NW, NE, SW, SE.
+DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+DIRS_KING = (0, 1, 2, 3)
+DIRS_RED = (0, 1)    # red men move up the board
+DIRS_BLUE = (2, 3)   # blue men move down
+
+def _build_move_tables():
+    steps = []
+    jumps = []
+    for idx in range(64):
+        r, c = idx >> 3, idx & 7
+        srow = []
+        jrow = []
+        for dr, dc in DIRECTIONS:
+            nr, nc = r + dr, c + dc
+            lr, lc = r + 2*dr, c + 2*dc
+            on_board = 0 <= nr < ROWS and 0 <= nc < COLS
+            srow.append((1 << (nr*8 + nc), nr, nc) if on_board else None)
+            if on_board and 0 <= lr < ROWS and 0 <= lc < COLS:
+                jrow.append((1 << (nr*8 + nc), 1 << (lr*8 + lc), lr, lc))
+            else:
+                jrow.append(None)
+        steps.append(tuple(srow))
+        jumps.append(tuple(jrow))
+    return tuple(steps), tuple(jumps)
+
+STEP_TABLE, JUMP_TABLE = _build_move_tables()
+
+def board_to_grid(board):
+    """Derive the display 2D list (draw code still thinks in rows/columns).
+
+    Walks only the set bits of the four masks, so the cost scales with the
+    number of pieces on the board rather than all 64 squares."""
+    grid = [[0]*COLS for _ in range(ROWS)]
+    for value, mask in zip((1, 2, -1, -2), board):
+        while mask:
+            b = mask & -mask
+            mask ^= b
+            idx = b.bit_length() - 1
+            grid[idx >> 3][idx & 7] = value
+    return grid
 
 # ----- Board Setup -----
+# We use:  1 = Red (bottom),  2 = Red King
+#        -1 = Blue (top), -2 = Blue King
+_BLUE_START = sum(sq_bit(r, c) for r in range(3) for c in range(COLS)
+                  if (r + c) % 2 == 1)
+_RED_START = sum(sq_bit(r, c) for r in range(5, 8) for c in range(COLS)
+                 if (r + c) % 2 == 1)
+
 def initial_board():
-    b = [[0]*COLS for _ in range(ROWS)]
-    # We'll use:  1 = Red (bottom),  2 = Red King
-    #           -1 = Blue (top), -2 = Blue King
-    for r in range(3):
-        for c in range(COLS):
-            if (r + c) % 2 == 1:
-                b[r][c] = -1
-    for r in range(5, 8):
-        for c in range(COLS):
-            if (r + c) % 2 == 1:
-                b[r][c] = 1
-    return b
+    return (_RED_START, 0, _BLUE_START, 0)
+
+# ----- Zobrist hashing -----
+# Every (piece type, square) pair gets a random 64-bit key; a position's
+# hash is the XOR of the keys of its pieces, plus a side-to-move key.
+# The generator is seeded so hashes are stable across runs.
+_zrng = random.Random(0xC4)
+ZOBRIST = {piece: [_zrng.getrandbits(64) for _ in range(64)]
+           for piece in (1, 2, -1, -2)}
+ZOBRIST_TURN = _zrng.getrandbits(64)
+del _zrng
+
+def board_hash(board, player):
+    """Zobrist hash of a position, including the side to move."""
+    h = 0 if player == 1 else ZOBRIST_TURN
+    for value, mask in zip((1, 2, -1, -2), board):
+        keys = ZOBRIST[value]
+        while mask:
+            b = mask & -mask
+            mask ^= b
+            h ^= keys[b.bit_length() - 1]
+    return h
+
+# Transposition table for get_all_moves: hash -> move list.  Cleared
+# wholesale when full; positions repeat often enough (forced-capture
+# checks, future search) that even this crude policy pays off.
+TT = {}
+TT_MAX = 1 << 16
 
 # ----- Move Generation -----
 def get_piece_moves(board, r, c):
@@ -62,121 +144,290 @@ def get_piece_moves(board, r, c):
       - capture_moves: list of paths for captures (multi-jump allowed)
     Each path is the list of landing squares in order (for single-step it is length 1).
     """
-    piece = board[r][c]
+    piece = piece_at(board, r, c)
     if piece == 0:
         return [], []
 
     color = 1 if piece > 0 else -1
     king = abs(piece) == 2
 
-    # direction list
+    # direction indices into the move tables
     if king:
-        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        dir_idx = DIRS_KING
     else:
-        directions = [(-1, -1), (-1, 1)] if color == 1 else [(1, -1), (1, 1)]
+        dir_idx = DIRS_RED if color == 1 else DIRS_BLUE
 
     normal_moves = []
     capture_moves = []
 
     # normal (simple) moves
-    for dr, dc in directions:
-        nr, nc = r + dr, c + dc
-        if in_bounds(nr, nc) and board[nr][nc] == 0:
-            normal_moves.append([(nr, nc)])
+    red_men, red_kings, blue_men, blue_kings = board
+    empty = ~(red_men | red_kings | blue_men | blue_kings) & FULL
+    steps = STEP_TABLE[r*8 + c]
+    for d in dir_idx:
+        step = steps[d]
+        if step is not None and step[0] & empty:
+            normal_moves.append([(step[1], step[2])])
+
+    # captures: DFS to find multi-jumps.  Board state travels as four plain
+    # ints and the working path is extended/retracted in place (make/unmake),
+    # so a jump allocates nothing.  No visited set is needed: each jump
+    # removes the captured piece, so a square can never be jumped twice.
+    path = []
 
-    # captures: DFS to find multi-jumps
-    def dfs(bd, cr, cc, path, visited):
+    def dfs(rm, rk, bm, bk, cr, cc, pc):
         found_any = False
-        pc = bd[cr][cc]
-        scan_dirs = [(-1,-1),(-1,1),(1,-1),(1,1)] if abs(pc)==2 else \
-                    ([(-1,-1),(-1,1)] if pc>0 else [(1,-1),(1,1)])
-        for dr, dc in scan_dirs:
-            mr, mc = cr + dr, cc + dc  # middle
-            lr, lc = cr + 2*dr, cc + 2*dc  # landing
-            if in_bounds(mr, mc) and in_bounds(lr, lc):
-                if bd[mr][mc] != 0 and bd[mr][mc] * pc < 0 and bd[lr][lc] == 0:
-                    # perform jump on clone
-                    nb = clone_board(bd)
-                    nb[lr][lc] = nb[cr][cc]
-                    nb[cr][cc] = 0
-                    nb[mr][mc] = 0
-                    # king if lands on last row
-                    if nb[lr][lc] == 1 and lr == 0: nb[lr][lc] = 2
-                    if nb[lr][lc] == -1 and lr == ROWS-1: nb[lr][lc] = -2
-                    dfs(nb, lr, lc, path + [(lr, lc)], visited | {(mr,mc,lr,lc)})
-                    found_any = True
+        if abs(pc) == 2:
+            scan_idx = DIRS_KING
+        else:
+            scan_idx = DIRS_RED if pc > 0 else DIRS_BLUE
+        enemy = (bm | bk) if pc > 0 else (rm | rk)
+        empty = ~(rm | rk | bm | bk) & FULL
+        cb = sq_bit(cr, cc)
+        jumps = JUMP_TABLE[cr*8 + cc]
+        for d in scan_idx:
+            jump = jumps[d]
+            if jump is None:
+                continue
+            mid, land, lr, lc = jump
+            if (mid & enemy) and (land & empty):
+                # perform jump: three bit flips instead of a board copy
+                npc = pc
+                # king if lands on last row
+                if npc == 1 and lr == 0: npc = 2
+                if npc == -1 and lr == ROWS-1: npc = -2
+                nrm = rm & ~mid & ~cb
+                nrk = rk & ~mid & ~cb
+                nbm = bm & ~mid & ~cb
+                nbk = bk & ~mid & ~cb
+                if npc == 1: nrm |= land
+                elif npc == 2: nrk |= land
+                elif npc == -1: nbm |= land
+                else: nbk |= land
+                path.append((lr, lc))
+                dfs(nrm, nrk, nbm, nbk, lr, lc, npc)
+                path.pop()
+                found_any = True
         if not found_any and path:
             # finished sequence
-            capture_moves.append(path)
+            capture_moves.append(path[:])
 
-    dfs(board, r, c, [], set())
+    dfs(red_men, red_kings, blue_men, blue_kings, r, c, piece)
     return normal_moves, capture_moves
 
 def get_all_moves(board, player):
     """Return moves for player: list of (sr,sc,path) where path is list of landings.
-       Enforce forced captures: if any capture exists anywhere, return only captures."""
+       Enforce forced captures: if any capture exists anywhere, return only captures.
+       Moves come out in pruning-friendly order — captures longest first, then
+       kinging moves, then the rest — and are memoized in TT keyed by Zobrist hash."""
+    key = board_hash(board, player)
+    hit = TT.get(key)
+    if hit is not None:
+        return hit
     captures = []
     normals = []
-    for r in range(ROWS):
-        for c in range(COLS):
-            if board[r][c] * player > 0:
-                nm, cm = get_piece_moves(board, r, c)
-                for p in cm:
-                    captures.append((r, c, p))
-                for p in nm:
-                    normals.append((r, c, p))
-    return captures if captures else normals
+    red_men, red_kings, blue_men, blue_kings = board
+    own = (red_men | red_kings) if player == 1 else (blue_men | blue_kings)
+    while own:
+        b = own & -own
+        own ^= b
+        idx = b.bit_length() - 1
+        r, c = idx >> 3, idx & 7
+        nm, cm = get_piece_moves(board, r, c)
+        for p in cm:
+            captures.append((r, c, p))
+        for p in nm:
+            normals.append((r, c, p))
+    if captures:
+        captures.sort(key=lambda m: len(m[2]), reverse=True)
+        moves = captures
+    else:
+        def kinging_first(m):
+            pc = piece_at(board, m[0], m[1])
+            lr = m[2][-1][0]
+            return 0 if (pc == 1 and lr == 0) or (pc == -1 and lr == ROWS-1) else 1
+        normals.sort(key=kinging_first)
+        moves = normals
+    if len(TT) >= TT_MAX:
+        TT.clear()
+    TT[key] = moves
+    return moves
+
+# ----- Forced-capture cache -----
+# The click handler needs "do any captures exist for the side to move" on
+# every click to enforce forced captures.  Boards are immutable tuples, so
+# caching the last (board, turn) pair is enough: a move, undo or restart
+# produces a different key and invalidates the cache by itself.
+_captures_key = None
+_captures_cache = None
+
+def compute_all_captures(board, turn):
+    """Return (all_captures, by_square) for the side to move.
+
+    all_captures is a list of (r, c, path); by_square maps (r, c) to the
+    capture paths starting on that square.  Cached per (board, turn), so
+    repeated clicks in the same position cost a dict lookup instead of a
+    DFS over every piece."""
+    global _captures_key, _captures_cache
+    key = (board, turn)
+    if key == _captures_key:
+        return _captures_cache
+    captures = []
+    by_square = {}
+    own = (board[0] | board[1]) if turn == 1 else (board[2] | board[3])
+    while own:
+        b = own & -own
+        own ^= b
+        idx = b.bit_length() - 1
+        r, c = idx >> 3, idx & 7
+        _, cm = get_piece_moves(board, r, c)
+        if cm:
+            by_square[(r, c)] = cm
+            for p in cm:
+                captures.append((r, c, p))
+    _captures_key = key
+    _captures_cache = (captures, by_square)
+    return _captures_cache
 
 # ----- Apply Move -----
 def apply_move(board, move):
     """move = (sr, sc, path), path is list of landing coordinates (one or more)"""
     sr, sc, path = move
-    nb = clone_board(board)
-    piece = nb[sr][sc]
-    nb[sr][sc] = 0
+    piece = piece_at(board, sr, sc)
+    cleared = sq_bit(sr, sc)
     cr, cc = sr, sc
     for (nr, nc) in path:
         # if jumped
         if abs(nr - cr) == 2 or abs(nc - cc) == 2:
-            mr, mc = (nr + cr)//2, (nc + cc)//2
-            nb[mr][mc] = 0
+            cleared |= sq_bit((nr + cr)//2, (nc + cc)//2)
         cr, cc = nr, nc
-    nb[cr][cc] = piece
     # kinging
-    if nb[cr][cc] == 1 and cr == 0: nb[cr][cc] = 2
-    if nb[cr][cc] == -1 and cr == ROWS-1: nb[cr][cc] = -2
-    return nb
+    if piece == 1 and cr == 0: piece = 2
+    if piece == -1 and cr == ROWS-1: piece = -2
+    red_men, red_kings, blue_men, blue_kings = (bb & ~cleared for bb in board)
+    dest = sq_bit(cr, cc)
+    if piece == 1: red_men |= dest
+    elif piece == 2: red_kings |= dest
+    elif piece == -1: blue_men |= dest
+    else: blue_kings |= dest
+    return (red_men, red_kings, blue_men, blue_kings)
+
+# ----- Search (infrastructure for a future AI opponent) -----
+MAN_VALUE = 2
+KING_VALUE = 3
+WIN_SCORE = 1000
+
+def evaluate(board):
+    """Material balance from Red's point of view."""
+    red_men, red_kings, blue_men, blue_kings = board
+    return (MAN_VALUE * (red_men.bit_count() - blue_men.bit_count())
+            + KING_VALUE * (red_kings.bit_count() - blue_kings.bit_count()))
+
+def search(board, depth, alpha, beta, player):
+    """Negamax with alpha-beta pruning; score from player's point of view.
+
+    Leans on get_all_moves ordering captures (longest first) and kinging
+    moves ahead of the rest, which is what makes the alpha >= beta cutoff
+    fire early.  A side with no pieces or no legal moves has lost; deeper
+    losses score slightly better so the search prefers to delay them."""
+    if is_terminal(board):
+        return -(WIN_SCORE + depth)
+    if depth == 0:
+        return player * evaluate(board)
+    moves = get_all_moves(board, player)
+    if not moves:
+        return -(WIN_SCORE + depth)
+    best = -2 * WIN_SCORE
+    for move in moves:
+        score = -search(apply_move(board, move), depth - 1, -beta, -alpha, -player)
+        if score > best:
+            best = score
+        if best > alpha:
+            alpha = best
+        if alpha >= beta:
+            break
+    return best
+
+def best_move(board, player, depth=6):
+    """Return the strongest (sr, sc, path) for player, or None if no moves."""
+    best = None
+    best_score = -2 * WIN_SCORE
+    beta = 2 * WIN_SCORE
+    for move in get_all_moves(board, player):
+        score = -search(apply_move(board, move), depth - 1, -beta, -best_score, -player)
+        if score > best_score or best is None:
+            best_score = score
+            best = move
+    return best
 
 # ----- Terminal / Winner -----
 def is_terminal(board):
-    red = any(board[r][c] > 0 for r in range(ROWS) for c in range(COLS))
-    blue = any(board[r][c] < 0 for r in range(ROWS) for c in range(COLS))
-    return not red or not blue
+    red_men, red_kings, blue_men, blue_kings = board
+    return (red_men | red_kings) == 0 or (blue_men | blue_kings) == 0
 
 def winner(board):
-    red = any(board[r][c] > 0 for r in range(ROWS) for c in range(COLS))
-    blue = any(board[r][c] < 0 for r in range(ROWS) for c in range(COLS))
+    red_men, red_kings, blue_men, blue_kings = board
+    red = red_men | red_kings
+    blue = blue_men | blue_kings
     if red and not blue: return "Red"
     if blue and not red: return "Blue"
     return None
 
+# ----- Fonts (created once in main(), after pygame.init()) -----
+FONT_KING = None
+FONT_BIG = None
+FONT_SM = None
+KING_STAR_SURF = None
+MODE_SURF = None
+HELP_SURF = None
+
+def _init_fonts():
+    """Create the fonts and pre-render the static strings once.
+
+    SysFont re-parses system font metadata on every call and render
+    allocates a fresh surface, so neither belongs in per-frame code."""
+    global FONT_KING, FONT_BIG, FONT_SM, KING_STAR_SURF, MODE_SURF, HELP_SURF
+    FONT_KING = pygame.font.SysFont(None, 36)
+    FONT_BIG = pygame.font.SysFont("Arial", 26, bold=True)
+    FONT_SM = pygame.font.SysFont("Arial", 16)
+    KING_STAR_SURF = FONT_KING.render("★", True, (255, 255, 255))
+    MODE_SURF = FONT_SM.render("Mode: Human vs Human", True, TEXT)
+    HELP_SURF = FONT_SM.render("U = Undo   R = Restart   Q = Quit", True, (180, 180, 200))
+
 # ----- Drawing helpers -----
-def glow_circle(surface, color, pos, radius, intensity=8):
+GLOW_RED = None
+GLOW_BLUE = None
+
+def _make_glow(color, radius, intensity=8):
+    """Composite the layered glow rings once into a single SRCALPHA sprite."""
+    glow = pygame.Surface((radius*4, radius*4), pygame.SRCALPHA)
     for i in range(intensity, 0, -1):
         alpha = max(8, int(24 * (i/intensity)))
         s = pygame.Surface((radius*4, radius*4), pygame.SRCALPHA)
-        c = (*color, alpha)
-        pygame.draw.circle(s, c, (radius*2, radius*2), radius + i*2)
-        surface.blit(s, (pos[0]-radius*2, pos[1]-radius*2))
+        pygame.draw.circle(s, (*color, alpha), (radius*2, radius*2), radius + i*2)
+        glow.blit(s, (0, 0))
+    return glow
 
-def draw_board(surface, board, selected=None, moves=None, trails=None):
-    # background
-    surface.fill(BG)
-    # squares
+def _init_glows():
+    global GLOW_RED, GLOW_BLUE
+    GLOW_RED = _make_glow(NEON_RED, SQ//4)
+    GLOW_BLUE = _make_glow(NEON_BLUE, SQ//4)
+
+BOARD_BG = None
+
+def _init_board_bg():
+    """Pre-render the static checkerboard; the squares never change."""
+    global BOARD_BG
+    BOARD_BG = pygame.Surface((BOARD_SIZE, BOARD_SIZE))
+    BOARD_BG.fill(BG)
     for r in range(ROWS):
         for c in range(COLS):
             col = LIGHT_SQ if (r+c)%2==0 else DARK_SQ
-            pygame.draw.rect(surface, col, (c*SQ, r*SQ, SQ, SQ))
+            pygame.draw.rect(BOARD_BG, col, (c*SQ, r*SQ, SQ, SQ))
+
+def draw_board(surface, board, selected=None, moves=None, trails=None):
+    # background + squares (pre-rendered, never change)
+    surface.blit(BOARD_BG, (0, 0))
     # move highlights
     if moves:
         for (r,c) in moves:
@@ -184,19 +435,19 @@ def draw_board(surface, board, selected=None, moves=None, trails=None):
             pygame.draw.rect(s, (*MOVE_GLOW, 90), (0,0,SQ,SQ))
             surface.blit(s, (c*SQ, r*SQ))
     # pieces
+    grid = board_to_grid(board)
     for r in range(ROWS):
         for c in range(COLS):
-            v = board[r][c]
+            v = grid[r][c]
             if v != 0:
                 color = NEON_RED if v>0 else NEON_BLUE
                 center = (c*SQ + SQ//2, r*SQ + SQ//2)
-                glow_circle(surface, color, center, SQ//4)
+                glow = GLOW_RED if v > 0 else GLOW_BLUE
+                surface.blit(glow, (center[0] - SQ//2, center[1] - SQ//2))
                 pygame.draw.circle(surface, color, center, SQ//3)
                 if abs(v) == 2:
                     # king symbol
-                    font = pygame.font.SysFont(None, 36)
-                    txt = font.render("★", True, (255,255,255))
-                    surface.blit(txt, (center[0]-12, center[1]-16))
+                    surface.blit(KING_STAR_SURF, (center[0]-12, center[1]-16))
     # selected
     if selected:
         r,c = selected
@@ -206,23 +457,24 @@ def draw_board(surface, board, selected=None, moves=None, trails=None):
 
 def draw_panel(surface, red_score, blue_score, player):
     pygame.draw.rect(surface, (6,6,12), (0, BOARD_SIZE, WIDTH, PANEL_H))
-    font_big = pygame.font.SysFont("Arial", 26, bold=True)
-    font_sm = pygame.font.SysFont("Arial", 16)
-    m_txt = font_sm.render(f"Mode: Human vs Human", True, TEXT)
-    surface.blit(m_txt, (16, BOARD_SIZE + 8))
-    rt = font_big.render(f"Red (Bottom) Score: {red_score}", True, NEON_RED)
-    bt = font_big.render(f"Blue (Top) Score: {blue_score}", True, NEON_BLUE)
+    surface.blit(MODE_SURF, (16, BOARD_SIZE + 8))
+    rt = FONT_BIG.render(f"Red (Bottom) Score: {red_score}", True, NEON_RED)
+    bt = FONT_BIG.render(f"Blue (Top) Score: {blue_score}", True, NEON_BLUE)
     surface.blit(rt, (16, BOARD_SIZE + 36))
     surface.blit(bt, (320, BOARD_SIZE + 36))
-    turn_txt = font_big.render(f"Turn: {'Red' if player==1 else 'Blue'}", True, TEXT)
+    turn_txt = FONT_BIG.render(f"Turn: {'Red' if player==1 else 'Blue'}", True, TEXT)
     surface.blit(turn_txt, (16, BOARD_SIZE + 72))
-    help_txt = font_sm.render("U = Undo   R = Restart   Q = Quit", True, (180,180,200))
-    surface.blit(help_txt, (16, BOARD_SIZE + 104))
+    surface.blit(HELP_SURF, (16, BOARD_SIZE + 104))
 
 # ----- Win popup -----
 def show_win_popup(screen, winner_name):
     font_big = pygame.font.SysFont("Arial", 48, bold=True)
     font_sm = pygame.font.SysFont("Arial", 22)
+    # the text never changes while the popup is up; render it once
+    msg = font_big.render(f"{winner_name} Wins!", True, ACCENT)
+    msg_pos = (WIDTH//2 - msg.get_width()//2, HEIGHT//2 - 80)
+    hint = font_sm.render("Press R to Restart or Q to Quit", True, (200,200,200))
+    hint_pos = (WIDTH//2 - hint.get_width()//2, HEIGHT//2 + 10)
     while True:
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
@@ -233,15 +485,16 @@ def show_win_popup(screen, winner_name):
                 if e.key == pygame.K_q:
                     pygame.quit(); sys.exit()
         screen.fill((0,0,0))
-        msg = font_big.render(f"{winner_name} Wins!", True, ACCENT)
-        screen.blit(msg, (WIDTH//2 - msg.get_width()//2, HEIGHT//2 - 80))
-        hint = font_sm.render("Press R to Restart or Q to Quit", True, (200,200,200))
-        screen.blit(hint, (WIDTH//2 - hint.get_width()//2, HEIGHT//2 + 10))
+        screen.blit(msg, msg_pos)
+        screen.blit(hint, hint_pos)
         pygame.display.flip()
 
 # ----- Main -----
 def main():
     pygame.init()
+    _init_fonts()
+    _init_glows()
+    _init_board_bg()
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Neon Checkers — Two Player")
     clock = pygame.time.Clock()
@@ -254,6 +507,11 @@ def main():
     red_score = 0
     blue_score = 0
 
+    board_surface = pygame.Surface((BOARD_SIZE, BOARD_SIZE))
+    board_rect = pygame.Rect(0, 0, BOARD_SIZE, BOARD_SIZE)
+    panel_rect = pygame.Rect(0, BOARD_SIZE, WIDTH, PANEL_H)
+    dirty = True  # redraw only when the game state changed
+
     running = True
     while running:
         # check terminal
@@ -267,15 +525,17 @@ def main():
             if ans == "restart":
                 board = initial_board(); turn = 1; selected=None; legal_paths_for_selected=[]
                 undo_stack.clear()
+                dirty = True
                 continue
 
-        # draw
-        board_surface = pygame.Surface((BOARD_SIZE, BOARD_SIZE))
-        move_highlights = [p[-1] for p in legal_paths_for_selected] if legal_paths_for_selected else None
-        draw_board(board_surface, board, selected, move_highlights)
-        screen.blit(board_surface, (0,0))
-        draw_panel(screen, red_score, blue_score, turn)
-        pygame.display.flip()
+        # draw only when something changed; idle frames cost nothing
+        if dirty:
+            move_highlights = [p[-1] for p in legal_paths_for_selected] if legal_paths_for_selected else None
+            draw_board(board_surface, board, selected, move_highlights)
+            screen.blit(board_surface, (0,0))
+            draw_panel(screen, red_score, blue_score, turn)
+            pygame.display.update([board_rect, panel_rect])
+            dirty = False
         clock.tick(FPS)
 
         # events
@@ -290,12 +550,14 @@ def main():
                 if e.key == pygame.K_r:
                     board = initial_board(); turn = 1; selected=None; legal_paths_for_selected=[]
                     undo_stack.clear()
+                    dirty = True
                     continue
                 if e.key == pygame.K_u:
                     if undo_stack:
                         board, turn = undo_stack.pop()
                         selected = None
                         legal_paths_for_selected = []
+                        dirty = True
                     continue
             if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
                 mx, my = e.pos
@@ -303,24 +565,22 @@ def main():
                     continue
                 r = my // SQ
                 c = mx // SQ
-                piece = board[r][c]
+                piece = piece_at(board, r, c)
+                dirty = True  # every click may change selection/highlights
 
-                # build all captures for current player to enforce forced captures
-                all_captures = []
-                for rr in range(ROWS):
-                    for cc in range(COLS):
-                        if board[rr][cc] * turn > 0:
-                            _, cm = get_piece_moves(board, rr, cc)
-                            for p in cm:
-                                all_captures.append((rr, cc, p))
+                # captures for current player to enforce forced captures (cached)
+                all_captures, captures_by_square = compute_all_captures(board, turn)
 
                 if selected is None:
                     # select only own pieces
                     if piece * turn > 0:
                         selected = (r, c)
-                        nm, cm = get_piece_moves(board, r, c)
                         # If there are global captures, only show capture moves for this piece
-                        legal_paths_for_selected = cm if all_captures else nm
+                        if all_captures:
+                            legal_paths_for_selected = captures_by_square.get((r, c), [])
+                        else:
+                            nm, _ = get_piece_moves(board, r, c)
+                            legal_paths_for_selected = nm
                     else:
                         # clicked empty or opponent piece -> no select
                         selected = None
@@ -333,17 +593,17 @@ def main():
                             chosen_path = p
                             break
                     if chosen_path:
-                        # save undo
-                        undo_stack.append((clone_board(board), turn))
+                        # save undo (boards are immutable tuples, no copy needed)
+                        undo_stack.append((board, turn))
                         # apply move
                         board = apply_move(board, (selected[0], selected[1], chosen_path))
                         # after capture, check if that same piece has further captures (multi-jump)
                         end_r, end_c = chosen_path[-1]
                         _, further_caps = get_piece_moves(board, end_r, end_c)
-                        # Only allow multi-jump if a capture happened and further caps exist
-                        jumped = any(abs(chosen_path[i][0] - (selected[0] if i==0 else chosen_path[i-1][0])) == 2 or
-                                     abs(chosen_path[i][1] - (selected[1] if i==0 else chosen_path[i-1][1])) == 2
-                                     for i in range(len(chosen_path)))
+                        # Only allow multi-jump if a capture happened and further caps exist.
+                        # Checking the first step is enough: a move is either a single
+                        # slide or a capture chain whose every step is a jump.
+                        jumped = abs(chosen_path[0][0] - selected[0]) == 2
                         if jumped and further_caps:
                             # continue with same player's turn, but only that piece may move
                             selected = (end_r, end_c)
@@ -357,8 +617,11 @@ def main():
                         # reselect if user clicked own piece
                         if piece * turn > 0:
                             selected = (r, c)
-                            nm, cm = get_piece_moves(board, r, c)
-                            legal_paths_for_selected = cm if all_captures else nm
+                            if all_captures:
+                                legal_paths_for_selected = captures_by_square.get((r, c), [])
+                            else:
+                                nm, _ = get_piece_moves(board, r, c)
+                                legal_paths_for_selected = nm
                         else:
                             selected = None
                             legal_paths_for_selected = []